@@ -131,6 +131,13 @@ def create_main_interface():
         quiz_engine = components.get('quiz_engine', None)
         istqb_ai_tester = components.get('istqb_ai_tester', None)
     
+    # Curriculum week content and resources styles, sent once with the page
+    curriculum_css_path = Path(__file__).parent / "components" / "curriculum.css"
+    curriculum_css = curriculum_css_path.read_text(encoding="utf-8") if curriculum_css_path.exists() else ""
+    # Notes and resources button handlers; scripts inside gr.HTML never run, so they go in the page head
+    curriculum_js_path = Path(__file__).parent / "components" / "curriculum.js"
+    curriculum_head = f"<script>{curriculum_js_path.read_text(encoding='utf-8')}</script>" if curriculum_js_path.exists() else ""
+    
     with gr.Blocks(
         theme=gr.themes.Soft(
             primary_hue="blue",
@@ -168,7 +175,8 @@ def create_main_interface():
             margin: 1rem 0;
         }
 
-        """
+        """ + curriculum_css,
+        head=curriculum_head
     ) as app:
         
         # Header
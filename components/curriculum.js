@@ -0,0 +1,60 @@
+// Button handlers for the curriculum tab, loaded once through the page head
+
+// Note card buttons in the notes list
+function editNote(noteId, title, content) {
+    // This would trigger the edit functionality
+    // In a real implementation, you'd use Gradio's JavaScript API
+    console.log('Edit note:', noteId, title, content);
+}
+
+function deleteNote(noteId, weekNum) {
+    if (confirm('Are you sure you want to delete this note?')) {
+        // This would trigger the delete functionality
+        console.log('Delete note:', noteId, 'for week:', weekNum);
+    }
+}
+
+// Category toggles and toolbar buttons on the AIGP resources page
+function toggleCategory(categoryId) {
+    const content = document.getElementById(categoryId);
+    const toggleBtn = document.getElementById('toggle-' + categoryId);
+
+    if (content.style.display === 'none' || content.style.display === '') {
+        content.style.display = 'block';
+        toggleBtn.innerHTML = '🔽';
+    } else {
+        content.style.display = 'none';
+        toggleBtn.innerHTML = '▶️';
+    }
+}
+
+function expandAll() {
+    const allContents = document.querySelectorAll('[id$="-content"]');
+    const allButtons = document.querySelectorAll('[id^="toggle-"]');
+
+    allContents.forEach(content => {
+        content.style.display = 'block';
+    });
+
+    allButtons.forEach(btn => {
+        btn.innerHTML = '🔽';
+    });
+}
+
+function collapseAll() {
+    const allContents = document.querySelectorAll('[id$="-content"]');
+    const allButtons = document.querySelectorAll('[id^="toggle-"]');
+
+    allContents.forEach(content => {
+        content.style.display = 'none';
+    });
+
+    allButtons.forEach(btn => {
+        btn.innerHTML = '▶️';
+    });
+}
+
+function hideResources() {
+    const resourcesContainer = document.getElementById('resources-container');
+    resourcesContainer.style.display = 'none';
+}
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Test script to verify curriculum content rendering and resource lookups
+"""
+
+import sys
+import os
+import tempfile
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from components.auth_manager import AuthManager
+from components.curriculum import CurriculumManager
+
+def _logged_in_manager(tmp_dir):
+    """Curriculum manager on throwaway user and notes databases, logged in as a new student"""
+    auth_manager = AuthManager(db_path=os.path.join(tmp_dir, "users.db"))
+    curriculum_manager = CurriculumManager(auth_manager=auth_manager)
+    curriculum_manager.notes_db_path = os.path.join(tmp_dir, "notes.db")
+    curriculum_manager.init_notes_database()
+    
+    success, message = auth_manager.create_user("student@example.com", "notes-pass-123")
+    assert success, message
+    success, result = auth_manager.authenticate_user("student@example.com", "notes-pass-123")
+    assert success, result
+    assert auth_manager.is_logged_in()
+    return curriculum_manager
+
+def test_resources_html_cache():
+    """Test that the resources page is rendered once and reused"""
+    print("🧪 Testing resources page cache...")
+    
+    curriculum_manager = CurriculumManager()
+    
+    resources_html = curriculum_manager.aigp_resources_html
+    assert curriculum_manager.aigp_resources_html is resources_html, "Resources page should be rendered once"
+    assert CurriculumManager().aigp_resources_html == resources_html, "A fresh manager should render the same page"
+    print("✅ Resources page cache works")
+
+def test_week_html_cache():
+    """Test that week cards are rendered once and out-of-range weeks fall back"""
+    print("🧪 Testing week content cache...")
+    
+    curriculum_manager = CurriculumManager()
+    
+    week_one = curriculum_manager.get_week_html(1)
+    assert curriculum_manager.get_week_html(1) is week_one, "Second view should reuse the rendered card"
+    assert curriculum_manager.curriculum_data['modules'][0]['title'] in week_one
+    
+    for week_num in (None, 0, 13):
+        assert curriculum_manager.get_week_html(week_num) == "Select a week to view content"
+    assert CurriculumManager().get_week_html(1) == week_one, "A fresh manager should render the same card"
+    print("✅ Week content cache works")
+
+def test_notes_html_cache():
+    """Test that cached notes HTML is refreshed after a note is created"""
+    print("🧪 Testing notes HTML cache...")
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        curriculum_manager = _logged_in_manager(tmp_dir)
+        
+        first = curriculum_manager.get_notes_html(1)
+        assert curriculum_manager.get_notes_html(1) is first, "Second view should be served from cache"
+        
+        success, message = curriculum_manager.create_note(1, "Cache Note", "Cached content")
+        assert success, message
+        refreshed = curriculum_manager.get_notes_html(1)
+        assert "Cache Note" in refreshed, "Creating a note should invalidate the cached week"
+        
+        note_id = curriculum_manager.get_user_notes(1)[0]['id']
+        success, message = curriculum_manager.update_note(note_id, "Edited Note", "Edited content")
+        assert success, message
+        assert "Edited Note" in curriculum_manager.get_notes_html(1), "Editing a note should invalidate its week"
+        
+        success, message = curriculum_manager.delete_note(note_id)
+        assert success, message
+        assert "Edited Note" not in curriculum_manager.get_notes_html(1), "Deleting a note should invalidate its week"
+        
+        curriculum_manager.auth_manager.logout()
+        assert not curriculum_manager.auth_manager.is_logged_in()
+    print("✅ Notes HTML cache invalidates on change")
+
+def test_notes_pagination():
+    """Test that the notes list is split into pages"""
+    print("🧪 Testing notes pagination...")
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        curriculum_manager = _logged_in_manager(tmp_dir)
+        
+        for i in range(25):
+            success, message = curriculum_manager.create_note(3, f"Paged Note {i}", f"Content {i}")
+            assert success, message
+        
+        first_page = curriculum_manager.get_notes_html(3)
+        second_page = curriculum_manager.get_notes_html(3, page=1)
+        assert first_page.count("✏️ Edit") == 20
+        assert second_page.count("✏️ Edit") == 5
+        assert curriculum_manager.has_notes_page(3, 1)
+        assert not curriculum_manager.has_notes_page(3, 2)
+        
+        curriculum_manager.auth_manager.logout()
+    print("✅ Notes are paginated")
+
+if __name__ == "__main__":
+    try:
+        test_resources_html_cache()
+        test_week_html_cache()
+        test_notes_html_cache()
+        test_notes_pagination()
+        print("✅ All tests passed!")
+    except Exception as e:
+        print(f"❌ Test failed: {e}")
+        sys.exit(1)